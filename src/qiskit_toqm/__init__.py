@@ -1,4 +1,45 @@
-from .toqm_latency import latencies_from_target, latencies_from_simple
-from .toqm_strategy import ToqmHeuristicStrategy, ToqmOptimalStrategy
-from .toqm_strategy_presets import ToqmStrategyO0, ToqmStrategyO1, ToqmStrategyO2, ToqmStrategyO3
-from .toqm_swap import ToqmSwap
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .toqm_latency import latencies_from_target, latencies_from_simple
+    from .toqm_strategy import ToqmHeuristicStrategy, ToqmOptimalStrategy
+    from .toqm_strategy_presets import ToqmStrategyO0, ToqmStrategyO1, ToqmStrategyO2, ToqmStrategyO3
+    from .toqm_swap import ToqmSwap
+
+# Submodule that provides each public name, used to resolve attribute
+# accesses lazily (PEP 562). Importing a name pulls in only the module
+# that defines it, so e.g. accessing a strategy preset doesn't load the
+# transpiler pass (and with it, most of qiskit).
+_lazy = {
+    "latencies_from_target": "toqm_latency",
+    "latencies_from_simple": "toqm_latency",
+    "ToqmHeuristicStrategy": "toqm_strategy",
+    "ToqmOptimalStrategy": "toqm_strategy",
+    "ToqmStrategyO0": "toqm_strategy_presets",
+    "ToqmStrategyO1": "toqm_strategy_presets",
+    "ToqmStrategyO2": "toqm_strategy_presets",
+    "ToqmStrategyO3": "toqm_strategy_presets",
+    "ToqmSwap": "toqm_swap",
+}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module("." + module_name, __name__)
+    value = getattr(module, name)
+
+    # Cache on the package so subsequent accesses skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
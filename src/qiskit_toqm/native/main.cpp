@@ -133,8 +133,10 @@ PYBIND11_MODULE(_core, m) {
 			}))
 			.def("setRetainPopped", &ToqmMapper::setRetainPopped)
 			.def("setVerbose", &ToqmMapper::setVerbose)
-			.def("run", static_cast<std::unique_ptr<ToqmResult> (ToqmMapper::*)(const std::vector<GateOp> &, std::size_t, const CouplingMap &) const>(&ToqmMapper::run))
-			.def("run", static_cast<std::unique_ptr<ToqmResult> (ToqmMapper::*)(const std::vector<GateOp> &, std::size_t, const CouplingMap &, const std::vector<int> &) const>(&ToqmMapper::run));
+			// The mapper's search is long-running pure C++, so release the GIL
+			// while it executes to let other Python threads make progress.
+			.def("run", static_cast<std::unique_ptr<ToqmResult> (ToqmMapper::*)(const std::vector<GateOp> &, std::size_t, const CouplingMap &) const>(&ToqmMapper::run), py::call_guard<py::gil_scoped_release>())
+			.def("run", static_cast<std::unique_ptr<ToqmResult> (ToqmMapper::*)(const std::vector<GateOp> &, std::size_t, const CouplingMap &, const std::vector<int> &) const>(&ToqmMapper::run), py::call_guard<py::gil_scoped_release>());
 
 #ifdef VERSION_INFO
     m.attr("__version__") = MACRO_STRINGIFY(VERSION_INFO);
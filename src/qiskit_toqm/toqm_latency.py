@@ -10,20 +10,32 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import qiskit
-from qiskit.transpiler import TranspilerError
-import qiskit_toqm.native as toqm
+import functools
+import math
+import weakref
 
 from itertools import chain
 
+# Note: qiskit and the compiled native extension are imported lazily within
+# the functions below. Both are expensive to load, and neither is needed just
+# to import this module (or, for qiskit, when the target already provides
+# durations for all swap gates).
+
 
 def _calc_swap_durations(coupling_map, instruction_durations, basis_gates, backend_properties, target):
     """Calculates the durations of swap gates between each coupling on the target."""
-    # Filter for couplings that don't already have a native swap.
-    couplings = [
-        c for c in coupling_map.get_edges()
-        if ("swap", c) not in instruction_durations.duration_by_name_qubits
-    ]
+    from qiskit.transpiler import TranspilerError
+
+    # Filter for couplings that don't already have a native swap. Collect
+    # the natively-swappable pairs once up front instead of probing the
+    # full (name, qubits) duration mapping per edge.
+    native_swaps = {
+        qubits
+        for (name, qubits) in instruction_durations.duration_by_name_qubits
+        if name == "swap"
+    }
+    edges = coupling_map.get_edges()
+    couplings = [c for c in edges if tuple(c) not in native_swaps]
 
     if not couplings:
         return
@@ -35,32 +47,98 @@ def _calc_swap_durations(coupling_map, instruction_durations, basis_gates, backe
             "'instruction_durations' has durations for all swap gates."
         )
 
-    def gen_swap_circuit(s, t):
-        # Generates a circuit with a single swap gate between src and tgt
-        c = qiskit.QuantumCircuit(coupling_map.size())
-        c.swap(s, t)
-        return c
-
-    # Batch transpile generated swap circuits
-    swap_circuits = qiskit.transpile(
-        [gen_swap_circuit(*pair) for pair in couplings],
-        basis_gates=basis_gates,
-        coupling_map=coupling_map,
-        backend_properties=backend_properties if target is None else None,
-        instruction_durations=instruction_durations,
-        target=target,
-        optimization_level=0,
-        layout_method="trivial",
-        scheduling_method="asap"
-    )
+    if target is not None:
+        basis_gates = list(target.operation_names)
+
+    unit = "dt" if instruction_durations.dt else "s"
+    get_duration = instruction_durations.get
+    duration_by_name_qubits = instruction_durations.duration_by_name_qubits
+
+    # Fast path: with cx in the basis, a swap between coupled qubits
+    # decomposes to cx(src, tgt); cx(tgt, src); cx(src, tgt), so whenever
+    # durations exist for both cx directions the swap duration follows
+    # analytically, with no transpilation (or qiskit import) at all.
+    has_cx = basis_gates is not None and "cx" in basis_gates
+
+    remaining = []
+    for src, tgt in couplings:
+        if has_cx and ("cx", (src, tgt)) in duration_by_name_qubits and ("cx", (tgt, src)) in duration_by_name_qubits:
+            forward = get_duration("cx", [src, tgt], unit)
+            reverse = get_duration("cx", [tgt, src], unit)
+            yield src, tgt, forward + reverse + forward
+        else:
+            remaining.append((src, tgt))
+
+    if not remaining:
+        return
+
+    import qiskit
+    from qiskit.transpiler import CouplingMap
 
-    for (src, tgt), qc in zip(couplings, swap_circuits):
-        if instruction_durations.dt is None and qc.unit == "dt":
-            # TODO: should be able to convert by looking up an op in both
-            raise TranspilerError("Incompatible units.")
+    edge_set = set(edges)
 
-        duration = qc.qubit_duration(src, tgt)
-        yield src, tgt, duration
+    # At optimization level 0, the decomposition of a swap depends only on
+    # the basis and on whether the reverse direction of the edge is also
+    # coupled, so we transpile a single two-qubit template per direction
+    # class and replay its gate sequence against each edge's durations,
+    # rather than transpiling one full-width circuit per edge.
+    template_cache = {}
+
+    def swap_ops(both_directions):
+        if both_directions not in template_cache:
+            template = qiskit.QuantumCircuit(2)
+            template.swap(0, 1)
+            edges = [[0, 1], [1, 0]] if both_directions else [[0, 1]]
+            transpiled = qiskit.transpile(
+                template,
+                basis_gates=basis_gates,
+                coupling_map=CouplingMap(edges),
+                optimization_level=0,
+                layout_method="trivial"
+            )
+            template_cache[both_directions] = [
+                (instr.operation.name, tuple(transpiled.find_bit(q).index for q in instr.qubits))
+                for instr in transpiled.data
+            ]
+
+        return template_cache[both_directions]
+
+    for src, tgt in remaining:
+        qubits = (src, tgt)
+
+        # ASAP-schedule the template's ops onto the edge to find the
+        # duration of the swap, i.e. the later of the two qubits' stop times.
+        stop_times = [0, 0]
+        for op_name, qargs in swap_ops((tgt, src) in edge_set):
+            stop = max(stop_times[q] for q in qargs) + get_duration(op_name, [qubits[q] for q in qargs], unit)
+            for q in qargs:
+                stop_times[q] = stop
+
+        yield src, tgt, max(stop_times)
+
+
+# Memoized results of latencies_from_target. When a target is given, results
+# are held in a weak mapping keyed on the target object itself, so each
+# entry's lifetime tracks its target and a recycled id() can never alias a
+# dead backend's latencies. Otherwise results are keyed by a fingerprint of
+# the remaining arguments. Repeated transpiles against the same backend
+# re-request the same latency data, so a handful of entries goes a long way.
+_target_cache = weakref.WeakKeyDictionary()
+_latency_cache = {}
+_LATENCY_CACHE_MAX = 8
+
+
+def _latency_cache_key(coupling_map, instruction_durations, basis_gates, backend_properties, normalize_scale):
+    """Builds a hashable fingerprint of the latencies_from_target arguments."""
+    return (
+        tuple(coupling_map.get_edges()),
+        instruction_durations.dt,
+        tuple(sorted(instruction_durations.duration_by_name.items())),
+        tuple(sorted(instruction_durations.duration_by_name_qubits.items())),
+        tuple(basis_gates) if basis_gates is not None else None,
+        id(backend_properties) if backend_properties is not None else None,
+        normalize_scale,
+    )
 
 
 def latencies_from_target(
@@ -75,6 +153,10 @@ def latencies_from_target(
     Generate a list of native ``LatencyDescription`` objects for
     the specified target device.
 
+    Results are cached, so repeated calls against the same target (common
+    when transpiling many circuits in one process) return the same list
+    without recomputing swap durations.
+
     Args:
         coupling_map (Optional[CouplingMap]): CouplingMap of the target backend.
             Required unless ``target`` is specified.
@@ -101,51 +183,133 @@ def latencies_from_target(
             where min_duration is the length of the fastest non-zero duration
             instruction on the target.
     """
+    if target is not None:
+        try:
+            per_target = _target_cache.setdefault(target, {})
+        except TypeError:
+            # The target type doesn't support weak references; fall back to
+            # keying on identity in the bounded cache below. Eviction keeps
+            # a stale entry from outliving a recycled id() for long.
+            key = (id(target), normalize_scale)
+        else:
+            if normalize_scale not in per_target:
+                per_target[normalize_scale] = list(_gen_latencies(
+                    coupling_map, instruction_durations, basis_gates, backend_properties, target, normalize_scale
+                ))
+
+            return per_target[normalize_scale]
+    else:
+        key = _latency_cache_key(
+            coupling_map, instruction_durations, basis_gates, backend_properties, normalize_scale
+        )
+
+    if key not in _latency_cache:
+        latencies = list(_gen_latencies(
+            coupling_map, instruction_durations, basis_gates, backend_properties, target, normalize_scale
+        ))
+
+        if len(_latency_cache) >= _LATENCY_CACHE_MAX:
+            # Evict the oldest entry (dicts preserve insertion order).
+            del _latency_cache[next(iter(_latency_cache))]
+
+        _latency_cache[key] = latencies
+
+    return _latency_cache[key]
+
+
+def _gen_latencies(coupling_map, instruction_durations, basis_gates, backend_properties, target, normalize_scale):
+    """Generates the latency descriptions behind ``latencies_from_target``."""
+    import numpy as np
+
+    from qiskit.transpiler import TranspilerError
+    import qiskit_toqm.native as toqm
+
     if target is not None:
         coupling_map = target.build_coupling_map()
         instruction_durations = target.durations()
         basis_gates = target.operation_names
 
-    unit = "dt" if instruction_durations.dt else "s"
+    from qiskit.circuit.duration import duration_in_dt
+
+    dt = instruction_durations.dt
+    unit = "dt" if dt else "s"
+
+    def to_unit(duration, from_unit):
+        # Converts a stored duration to `unit`, mirroring the unit handling
+        # of InstructionDurations.get without its per-call dispatch and key
+        # normalization. Returns None for conversions we don't fast-path
+        # (e.g. sub-second SI prefixes), which fall back to get().
+        if from_unit == unit:
+            return duration
+        if from_unit == "s" and unit == "dt":
+            return duration_in_dt(duration, dt)
+        if from_unit == "dt" and unit == "s":
+            return duration * dt
+        return None
+
+    get_duration = instruction_durations.get
 
     swap_durations = list(_calc_swap_durations(coupling_map, instruction_durations, basis_gates, backend_properties, target))
-    default_op_durations = [
-        (op_name, instruction_durations.get(op_name, [], unit))
-        for op_name in instruction_durations.duration_by_name
-    ]
-    op_durations = [
-        (op_name, bits, instruction_durations.get(op_name, bits, unit))
-        for (op_name, bits) in instruction_durations.duration_by_name_qubits
-    ]
 
-    non_zero_durations = [d for d in chain(
+    default_op_durations = []
+    for op_name, (duration, stored_unit) in instruction_durations.duration_by_name.items():
+        converted = to_unit(duration, stored_unit)
+        if converted is None:
+            converted = get_duration(op_name, [], unit)
+        default_op_durations.append((op_name, converted))
+
+    op_durations = []
+    for (op_name, bits), (duration, stored_unit) in instruction_durations.duration_by_name_qubits.items():
+        converted = to_unit(duration, stored_unit)
+        if converted is None:
+            converted = get_duration(op_name, bits, unit)
+        op_durations.append((op_name, bits, converted))
+
+    # Find the fastest non-zero duration in a single pass, rather than
+    # materializing an intermediate list just to take its min().
+    min_duration = math.inf
+    for duration in chain(
         (d for (_, d) in default_op_durations),
         (d for (_, _, d) in op_durations),
         (d for (_, _, d) in swap_durations)
-    ) if d > 0]
+    ):
+        if 0 < duration < min_duration:
+            min_duration = duration
 
-    if not non_zero_durations:
+    if math.isinf(min_duration):
         raise TranspilerError("Durations must be specified for the target.")
 
-    min_duration = min(non_zero_durations)
+    scale = normalize_scale / min_duration
 
-    def normalize(d):
-        return round(d * normalize_scale / min_duration)
+    # Quantize all durations to cycles in a single vectorized pass.
+    # np.rint rounds half to even, matching the round() builtin.
+    durations = np.fromiter(
+        chain(
+            (d for (_, d) in default_op_durations),
+            (d for (_, _, d) in op_durations),
+            (d for (_, _, d) in swap_durations)
+        ),
+        dtype=np.float64,
+        count=len(default_op_durations) + len(op_durations) + len(swap_durations)
+    )
+    cycles = iter(np.rint(durations * scale).astype(np.int64).tolist())
 
     # Yield latency descriptions with durations interpolated to cycles.
-    for op_name, duration in default_op_durations:
+    for op_name, _ in default_op_durations:
         # We don't know if the instruction is for 1 or 2 qubits, so emit
         # defaults for both.
-        yield toqm.LatencyDescription(1, op_name, normalize(duration))
-        yield toqm.LatencyDescription(2, op_name, normalize(duration))
+        cycle = next(cycles)
+        yield toqm.LatencyDescription(1, op_name, cycle)
+        yield toqm.LatencyDescription(2, op_name, cycle)
 
-    for op_name, qubits, duration in op_durations:
-        yield toqm.LatencyDescription(op_name, *qubits, normalize(duration))
+    for op_name, qubits, _ in op_durations:
+        yield toqm.LatencyDescription(op_name, *qubits, next(cycles))
 
-    for src, tgt, duration in swap_durations:
-        yield toqm.LatencyDescription("swap", src, tgt, normalize(duration))
+    for src, tgt, _ in swap_durations:
+        yield toqm.LatencyDescription("swap", src, tgt, next(cycles))
 
 
+@functools.lru_cache(maxsize=32)
 def latencies_from_simple(one_qubit_cycles, two_qubit_cycles, swap_cycles):
     """
     Generate a list of native ``LatencyDescription`` objects for
@@ -155,11 +319,17 @@ def latencies_from_simple(one_qubit_cycles, two_qubit_cycles, swap_cycles):
     all 1Q, 2Q, and SWAP gates execute in the corresponding number
     of cycles, irrespective of which qubits they execute on.
 
+    Results are cached, so repeated calls with the same cycle counts
+    return the same (shared) list, avoiding redundant construction of
+    the native descriptions. Callers must not mutate it.
+
     Args:
         one_qubit_cycles (int): The number of cycles for all 1Q gates.
         two_qubit_cycles (int): The number of cycles for all 2Q gates.
         swap_cycles (int): The number of cycles for all swap gates.
     """
+    import qiskit_toqm.native as toqm
+
     return [
         toqm.LatencyDescription(1, one_qubit_cycles),
         toqm.LatencyDescription(2, two_qubit_cycles),
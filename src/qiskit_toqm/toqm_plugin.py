@@ -15,6 +15,13 @@ from qiskit.transpiler.preset_passmanagers.plugin import PassManagerStagePlugin
 from qiskit.transpiler.preset_passmanagers import common
 from qiskit_toqm import *
 
+_OPT_LEVEL_TO_STRATEGY = {
+    0: ToqmStrategyO0,
+    1: ToqmStrategyO1,
+    2: ToqmStrategyO2,
+    3: ToqmStrategyO3,
+}
+
 
 class ToqmSwapPlugin(PassManagerStagePlugin):
 
@@ -22,14 +29,7 @@ class ToqmSwapPlugin(PassManagerStagePlugin):
         if pass_manager_config.initial_layout:
             raise TranspilerError("Initial layouts are not supported with TOQM-based routing.")
 
-        opt_level_to_strategy = {
-            0: ToqmStrategyO0,
-            1: ToqmStrategyO1,
-            2: ToqmStrategyO2,
-            3: ToqmStrategyO3,
-        }
-
-        toqm_strategy_preset = opt_level_to_strategy.get(optimization_level, ToqmStrategyO3)
+        toqm_strategy_preset = _OPT_LEVEL_TO_STRATEGY.get(optimization_level, ToqmStrategyO3)
 
         toqm_latencies = latencies_from_target(
             pass_manager_config.coupling_map,
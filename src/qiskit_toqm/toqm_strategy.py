@@ -13,6 +13,18 @@
 import qiskit_toqm.native as toqm
 
 
+def _resolve_table(latency_descriptions):
+    """Returns a native latency table for ``latency_descriptions``, which may
+    already be a prebuilt (possibly shared) table."""
+    if isinstance(latency_descriptions, toqm.Table):
+        return latency_descriptions
+
+    if not isinstance(latency_descriptions, list):
+        latency_descriptions = list(latency_descriptions)
+
+    return toqm.Table(latency_descriptions)
+
+
 class ToqmHeuristicStrategy:
     def __init__(self, latency_descriptions, top_k, queue_target, queue_max, retain_popped=1):
         """
@@ -22,8 +34,10 @@ class ToqmHeuristicStrategy:
         to exploring the best ``K`` children.
 
         Args:
-            latency_descriptions (List[toqm.LatencyDescription]): The latency descriptions
-            for all gates that will appear in the circuit, including swaps.
+            latency_descriptions (Union[List[toqm.LatencyDescription], toqm.Table]): The
+            latency descriptions for all gates that will appear in the circuit, including
+            swaps, or a prebuilt native latency table (which callers can share across
+            strategies to avoid rebuilding it).
             top_k (int): The maximum number of best child nodes that can be pushed to the
             queue during expansion of any given node.
             queue_target (int): When the priority queue reaches capacity, nodes are dropped
@@ -33,20 +47,40 @@ class ToqmHeuristicStrategy:
 
         Raises:
             RuntimeError: No routing was found.
+            ValueError: ``queue_max`` is smaller than ``queue_target``.
         """
-        # The following defaults are based on:
-        # https://github.com/time-optimal-qmapper/TOQM/blob/main/code/README.txt
-        self.mapper = toqm.ToqmMapper(
-            toqm.TrimSlowNodes(queue_max, queue_target),
-            toqm.GreedyTopK(top_k),
-            toqm.CXFrontier(),
-            toqm.Table(list(latency_descriptions)),
-            [toqm.GreedyMapper()],
-            [],
-            0
-        )
-
-        self.mapper.setRetainPopped(retain_popped)
+        if queue_max < queue_target:
+            raise ValueError("queue_max must be at least queue_target.")
+
+        self._latency_descriptions = latency_descriptions
+        self._top_k = top_k
+        self._queue_target = queue_target
+        self._queue_max = queue_max
+        self._retain_popped = retain_popped
+        self._mapper = None
+
+    @property
+    def mapper(self):
+        """The native mapper, constructed on first use so that strategies
+        instantiated but never run don't allocate native state."""
+        if self._mapper is None:
+            table = _resolve_table(self._latency_descriptions)
+
+            # The following defaults are based on:
+            # https://github.com/time-optimal-qmapper/TOQM/blob/main/code/README.txt
+            self._mapper = toqm.ToqmMapper(
+                toqm.TrimSlowNodes(self._queue_max, self._queue_target),
+                toqm.GreedyTopK(self._top_k),
+                toqm.CXFrontier(),
+                table,
+                [toqm.GreedyMapper()],
+                [],
+                0
+            )
+
+            self._mapper.setRetainPopped(self._retain_popped)
+
+        return self._mapper
 
     def __call__(self, gates, num_qubits, coupling_map):
         """
@@ -70,8 +104,10 @@ class ToqmOptimalStrategy:
         in terms of overall circuit duration.
 
         Args:
-            latency_descriptions (List[toqm.LatencyDescription]): The latency descriptions
-            for all gates that will appear in the circuit, including swaps.
+            latency_descriptions (Union[List[toqm.LatencyDescription], toqm.Table]): The
+            latency descriptions for all gates that will appear in the circuit, including
+            swaps, or a prebuilt native latency table (which callers can share across
+            strategies to avoid rebuilding it).
             perform_layout (Boolean): If true, permutes the initial layout rather than
             inserting swap gates at the start of the circuit.
             no_swaps (Boolean): If true, attempts to find a routing without inserting swaps.
@@ -79,17 +115,31 @@ class ToqmOptimalStrategy:
         Raises:
             RuntimeError: No routing was found.
         """
-        # The following defaults are based on:
-        # https://github.com/time-optimal-qmapper/TOQM/blob/main/code/README.txt
-        self.mapper = toqm.ToqmMapper(
-            toqm.DefaultQueue(),
-            toqm.NoSwaps() if no_swaps else toqm.DefaultExpander(),
-            toqm.CXFrontier(),
-            toqm.Table(latency_descriptions),
-            [],
-            [toqm.HashFilter(), toqm.HashFilter2()],
-            -1 if perform_layout else 0
-        )
+        self._latency_descriptions = latency_descriptions
+        self._perform_layout = perform_layout
+        self._no_swaps = no_swaps
+        self._mapper = None
+
+    @property
+    def mapper(self):
+        """The native mapper, constructed on first use so that strategies
+        instantiated but never run don't allocate native state."""
+        if self._mapper is None:
+            table = _resolve_table(self._latency_descriptions)
+
+            # The following defaults are based on:
+            # https://github.com/time-optimal-qmapper/TOQM/blob/main/code/README.txt
+            self._mapper = toqm.ToqmMapper(
+                toqm.DefaultQueue(),
+                toqm.NoSwaps() if self._no_swaps else toqm.DefaultExpander(),
+                toqm.CXFrontier(),
+                table,
+                [],
+                [toqm.HashFilter(), toqm.HashFilter2()],
+                -1 if self._perform_layout else 0
+            )
+
+        return self._mapper
 
     def __call__(self, gates, num_qubits, coupling_map):
         """
@@ -18,6 +18,19 @@ from qiskit_toqm import ToqmHeuristicStrategy, ToqmOptimalStrategy
 # This is tracked here: https://github.com/qiskit-toqm/libtoqm/issues/15
 from qiskit_toqm import latencies_from_simple
 
+import qiskit_toqm.native as toqm
+
+_SIMPLE_LATENCY_TABLE = None
+
+
+def _simple_latency_table():
+    """Returns the shared native table for the hard-coded 1/2/6 latencies
+    used by every preset (see the note above), built on first use."""
+    global _SIMPLE_LATENCY_TABLE
+    if _SIMPLE_LATENCY_TABLE is None:
+        _SIMPLE_LATENCY_TABLE = toqm.Table(latencies_from_simple(1, 2, 6))
+    return _SIMPLE_LATENCY_TABLE
+
 
 class ToqmStrategyO0:
     def __init__(self, latency_descriptions):
@@ -29,9 +42,9 @@ class ToqmStrategyO0:
             for all gates that will appear in the circuit, including swaps.
         """
         # https://github.com/qiskit-toqm/libtoqm/issues/15
-        latency_descriptions = latencies_from_simple(1, 2, 6)
+        latency_table = _simple_latency_table()
         self.heuristic_strategy = ToqmHeuristicStrategy(
-            latency_descriptions,
+            latency_table,
             top_k=1,
             queue_target=3000,
             queue_max=5000
@@ -53,14 +66,19 @@ class ToqmStrategyO1:
             for all gates that will appear in the circuit, including swaps.
         """
         # https://github.com/qiskit-toqm/libtoqm/issues/15
-        latency_descriptions = latencies_from_simple(1, 2, 6)
+        latency_table = _simple_latency_table()
 
         self.optimal_strategy = ToqmOptimalStrategy(
-            latency_descriptions
+            latency_table
+        )
+
+        self.optimal_strategy_no_swaps = ToqmOptimalStrategy(
+            latency_table,
+            no_swaps=True
         )
 
         self.heuristic_strategy = ToqmHeuristicStrategy(
-            latency_descriptions,
+            latency_table,
             top_k=5,
             queue_target=400,
             queue_max=800
@@ -68,7 +86,11 @@ class ToqmStrategyO1:
 
     def __call__(self, gates, num_qubits, coupling_map):
         if coupling_map.numPhysicalQubits < 6:
-            strategy = self.optimal_strategy
+            # try no swaps first
+            try:
+                return self.optimal_strategy_no_swaps(gates, num_qubits, coupling_map)
+            except RuntimeError:
+                strategy = self.optimal_strategy
         else:
             strategy = self.heuristic_strategy
 
@@ -87,22 +109,31 @@ class ToqmStrategyO2:
             for all gates that will appear in the circuit, including swaps.
         """
         # https://github.com/qiskit-toqm/libtoqm/issues/15
-        latency_descriptions = latencies_from_simple(1, 2, 6)
+        latency_table = _simple_latency_table()
 
         self.optimal_strategy = ToqmOptimalStrategy(
-            latency_descriptions
+            latency_table
+        )
+
+        self.optimal_strategy_no_swaps = ToqmOptimalStrategy(
+            latency_table,
+            no_swaps=True
         )
 
         self.heuristic_strategy = ToqmHeuristicStrategy(
-            latency_descriptions,
+            latency_table,
             top_k=11,
             queue_target=400,
-            queue_max=100
+            queue_max=1000
         )
 
     def __call__(self, gates, num_qubits, coupling_map):
         if coupling_map.numPhysicalQubits < 6:
-            strategy = self.optimal_strategy
+            # try no swaps first
+            try:
+                return self.optimal_strategy_no_swaps(gates, num_qubits, coupling_map)
+            except RuntimeError:
+                strategy = self.optimal_strategy
         else:
             strategy = self.heuristic_strategy
 
@@ -121,19 +152,19 @@ class ToqmStrategyO3:
             for all gates that will appear in the circuit, including swaps.
         """
         # https://github.com/qiskit-toqm/libtoqm/issues/15
-        latency_descriptions = latencies_from_simple(1, 2, 6)
+        latency_table = _simple_latency_table()
 
         self.optimal_strategy = ToqmOptimalStrategy(
-            latency_descriptions
+            latency_table
         )
 
         self.optimal_strategy_no_swaps = ToqmOptimalStrategy(
-            latency_descriptions,
+            latency_table,
             no_swaps=True
         )
 
         self.heuristic_strategy = ToqmHeuristicStrategy(
-            latency_descriptions,
+            latency_table,
             top_k=3,
             queue_target=3600,
             queue_max=4800
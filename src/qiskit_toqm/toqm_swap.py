@@ -10,6 +10,11 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 import logging
+import sys
+
+from collections import deque
+
+import numpy as np
 
 import qiskit_toqm.native as toqm
 
@@ -21,6 +26,32 @@ from qiskit.transpiler.exceptions import TranspilerError
 
 logger = logging.getLogger(__name__)
 
+# Gate type names the native mapper uses for the swaps it inserts. Checked
+# by membership so the hot rebuild loop doesn't allocate a lowercased copy
+# of every gate name just to compare it.
+_SWAP_NAMES = frozenset(("swap", "SWAP", "Swap", "swp", "SWP"))
+
+
+def _format_gate(g):
+    """Formats a native scheduled gate for debug logging."""
+    gate_op = g.gateOp
+
+    if g.physicalControl >= 0:
+        physical = f"q[{g.physicalControl}],q[{g.physicalTarget}]"
+    else:
+        physical = f"q[{g.physicalTarget}]"
+
+    line = f"{gate_op.type} {physical}; //cycle: {g.cycle}"
+
+    if gate_op.type not in _SWAP_NAMES:
+        if gate_op.control >= 0:
+            original = f"q[{gate_op.control}],q[{gate_op.target}]"
+        else:
+            original = f"q[{gate_op.target}]"
+        line += f" //{gate_op.type} {original};"
+
+    return line
+
 
 class ToqmSwap(TransformationPass):
     r"""Map input circuit onto a backend topology via insertion of SWAPs.
@@ -62,6 +93,10 @@ class ToqmSwap(TransformationPass):
         self.toqm_strategy = strategy
         self.toqm_result = None
 
+        # The coupling map is fixed for the lifetime of the pass, so build
+        # the native equivalent once here rather than on every run.
+        self._native_coupling = toqm.CouplingMap(coupling_map.size(), set(coupling_map.get_edges()))
+
     def run(self, dag: DAGCircuit):
         """Run the ToqmSwap pass on `dag`.
         Args:
@@ -75,53 +110,92 @@ class ToqmSwap(TransformationPass):
         if self.coupling_map is None:
             raise TranspilerError("TOQM swap not properly initialized.")
 
-        if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
+        # Each of these DAGCircuit accessors crosses into its implementation
+        # per call, so fetch them once up front.
+        qregs = dag.qregs
+        num_qubits = dag.num_qubits()
+
+        if len(qregs) != 1 or qregs.get("q", None) is None:
             raise TranspilerError("TOQM swap runs on physical circuits only.")
 
-        if len(dag.qubits) > self.coupling_map.size():
+        if num_qubits > self.coupling_map.size():
             raise TranspilerError("More virtual qubits exist than physical.")
 
-        reg = dag.qregs["q"]
-
-        # Generate UIDs for each gate node from the original circuit so we can
-        # look them up later when rebuilding the circuit.
-        # Note: this is still sorted by topological order from above.
-        uid_to_op_node = {uid: op for uid, op in enumerate(dag.topological_op_nodes())}
-
-        # Create TOQM topological gate list
-        def gates():
-            for uid, node in uid_to_op_node.items():
-                if len(node.qargs) == 2:
-                    yield toqm.GateOp(uid, node.op.name, reg.index(node.qargs[0]), reg.index(node.qargs[1]))
-                elif len(node.qargs) == 1:
-                    yield toqm.GateOp(uid, node.op.name, reg.index(node.qargs[0]))
-                else:
-                    raise TranspilerError(f"ToqmSwap only works with 1q and 2q gates! "
-                                          f"Bad gate: {node.op.name} {node.qargs}")
-
-        gate_ops = list(gates())
-        edges = {e for e in self.coupling_map.get_edges()}
-        couplings = toqm.CouplingMap(self.coupling_map.size(), edges)
-
-        self.toqm_result = self.toqm_strategy(gate_ops, dag.num_qubits(), couplings)
+        reg = qregs["q"]
+
+        # QuantumRegister.index is a linear scan; build a lookup table once
+        # so each qarg resolves in constant time.
+        qubit_to_idx = {bit: idx for idx, bit in enumerate(reg)}
+
+        # Gate UIDs are just positions in topological order, so a plain list
+        # doubles as the uid-to-node lookup used when rebuilding the circuit.
+        op_nodes = list(dag.topological_op_nodes())
+
+        # Create the TOQM topological gate list. Validate arities up front so
+        # the construction itself can run as a single C-level comprehension
+        # with no per-gate branching beyond a conditional expression.
+        for node in op_nodes:
+            if not 1 <= len(node.qargs) <= 2:
+                raise TranspilerError(f"ToqmSwap only works with 1q and 2q gates! "
+                                      f"Bad gate: {node.op.name} {node.qargs}")
+
+        # Gate names repeat heavily across a circuit (a dozen distinct names
+        # for thousands of gates), so intern them and let every GateOp for
+        # the same gate hand the binding layer one shared string object.
+        intern = sys.intern
+        gate_ops = [
+            toqm.GateOp(uid, intern(node.op.name), qubit_to_idx[node.qargs[0]], qubit_to_idx[node.qargs[1]])
+            if len(node.qargs) == 2
+            else toqm.GateOp(uid, intern(node.op.name), qubit_to_idx[node.qargs[0]])
+            for uid, node in enumerate(op_nodes)
+        ]
+
+        self.toqm_result = self.toqm_strategy(gate_ops, num_qubits, self._native_coupling)
+
+        # Like the result's other vector attributes, each scheduledGates
+        # access converts the whole native vector, so fetch it once and
+        # share it between the debug log and the rebuild loop.
+        scheduled_gates = self.toqm_result.scheduledGates
+
+        # Guarded so no formatting work happens unless debug is enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n".join(_format_gate(g) for g in scheduled_gates))
+
+        # Fast path: if the mapper inserted no swaps and left every qubit
+        # where it started, the schedule is just the input circuit in
+        # topological order, so skip the rebuild and layout update entirely.
+        if not any(g.gateOp.type in _SWAP_NAMES for g in scheduled_gates):
+            inferred_laq = np.asarray(self.toqm_result.inferredLaq)
+            if np.array_equal(inferred_laq, np.arange(inferred_laq.shape[0])):
+                return dag
 
         # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
         mapped_dag = dag.copy_empty_like()
 
-        for g in self.toqm_result.scheduledGates:
-            if g.gateOp.type.lower() == "swap":
-                mapped_dag.apply_operation_back(SwapGate(), qargs=[reg[g.physicalControl], reg[g.physicalTarget]])
+        # Hoist lookups out of the per-gate loop: bound method, plain-list
+        # qubit indexing, and a single shared SwapGate instance.
+        apply_back = mapped_dag.apply_operation_back
+        reg_list = list(reg)
+        swap_gate = SwapGate()
+
+        for g in scheduled_gates:
+            gate_op = g.gateOp
+            physical_control = g.physicalControl
+            physical_target = g.physicalTarget
+
+            if gate_op.type in _SWAP_NAMES:
+                apply_back(swap_gate, qargs=[reg_list[physical_control], reg_list[physical_target]])
                 continue
 
-            original_op = uid_to_op_node[g.gateOp.uid]
-            if g.physicalControl >= 0:
-                mapped_dag.apply_operation_back(original_op.op, cargs=original_op.cargs, qargs=[
-                    reg[g.physicalControl],
-                    reg[g.physicalTarget]
+            original_op = op_nodes[gate_op.uid]
+            if physical_control >= 0:
+                apply_back(original_op.op, cargs=original_op.cargs, qargs=[
+                    reg_list[physical_control],
+                    reg_list[physical_target]
                 ])
             else:
-                mapped_dag.apply_operation_back(original_op.op, cargs=original_op.cargs, qargs=[
-                    reg[g.physicalTarget]
+                apply_back(original_op.op, cargs=original_op.cargs, qargs=[
+                    reg_list[physical_target]
                 ])
 
         self._update_layout()
@@ -129,32 +203,39 @@ class ToqmSwap(TransformationPass):
         return mapped_dag
 
     def _update_layout(self):
+        result = self.toqm_result
+
+        # Each access to these pybind attributes converts the entire
+        # underlying native vector, so fetch each exactly once, into numpy
+        # arrays so the non-trivial entries can be found with vectorized
+        # masks rather than a Python-level scan of every qubit.
+        inferred_laq = np.asarray(result.inferredLaq)
+        inferred_qal = np.asarray(result.inferredQal)
+
         layout = self.property_set['layout']
+        p2v = layout.get_physical_bits()
 
-        # Need to copy this mapping since layout updates
-        # might overwrite original vbits we need to read!
-        p2v = layout.get_physical_bits().copy()
+        # Layout updates below might overwrite original vbits we still need
+        # to read, so snapshot them first. Only entries TOQM actually moved
+        # (or unmapped) are needed, not a copy of the whole mapping.
+        moved = np.flatnonzero(inferred_laq != np.arange(inferred_laq.shape[0]))
+        original_vbits = [(vidx, p2v[vidx]) for vidx in moved.tolist()]
 
         # Update the layout if TOQM made changes.
-        ancilla_vbits = []
-        for vidx in range(self.toqm_result.numPhysicalQubits):
-            pidx = self.toqm_result.inferredLaq[vidx]
+        laq = inferred_laq.tolist()
+        ancilla_vbits = deque()
+        for vidx, vbit in original_vbits:
+            pidx = laq[vidx]
 
             if pidx == -1:
                 # bit is not mapped to physical qubit
-                ancilla_vbits.append(p2v[vidx])
-                continue
-
-            if pidx != vidx:
-                # Bit was remapped!
-                # First, we need to get the original virtual bit from the layout.
-                vbit = p2v[vidx]
-
-                # Then, map updated pidx from TOQM to original virtual bit.
+                ancilla_vbits.append(vbit)
+            else:
+                # Bit was remapped! Map updated pidx from TOQM to the
+                # original virtual bit.
                 layout[pidx] = vbit
 
         # Map any unmapped physical bits to ancilla.
-        for pidx, vidx in enumerate(self.toqm_result.inferredQal):
-            if vidx < 0:
-                # Current physical bit isn't mapped. Map it to an ancilla.
-                layout[pidx] = ancilla_vbits.pop(0)
+        for pidx in np.flatnonzero(inferred_qal < 0).tolist():
+            # Current physical bit isn't mapped. Map it to an ancilla.
+            layout[pidx] = ancilla_vbits.popleft()
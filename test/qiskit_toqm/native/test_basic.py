@@ -1,3 +1,4 @@
+import sys
 import unittest
 
 import qiskit_toqm.native as toqm
@@ -33,18 +34,18 @@ class TestTOQM(unittest.TestCase):
 
         result = mapper.run(gates, num_q, coupling)
 
-        # Print result
+        # Print result as a single write rather than several print calls
+        # per gate, each of which would lock and flush stdout.
+        lines = []
         for g in result.scheduledGates:
-            print(f"{g.gateOp.type} ", end='')
-            if g.physicalControl >= 0:
-                print(f"q[{g.physicalControl}],", end='')
-            print(f"q[{g.physicalTarget}]; ", end='')
-
-            print(f"//cycle: {g.cycle}", end='')
-
-            if (g.gateOp.type.lower() != "swap"):
-                print(f" //{g.gateOp.type} ", end='')
-                if g.gateOp.control >= 0:
-                    print(f"q[{g.gateOp.control}],", end='')
-                print(f"q[{g.gateOp.target}]; ", end='')
-            print()
\ No newline at end of file
+            physical = f"q[{g.physicalControl}],q[{g.physicalTarget}]" if g.physicalControl >= 0 \
+                else f"q[{g.physicalTarget}]"
+            line = f"{g.gateOp.type} {physical}; //cycle: {g.cycle}"
+
+            if g.gateOp.type.lower() != "swap":
+                original = f"q[{g.gateOp.control}],q[{g.gateOp.target}]" if g.gateOp.control >= 0 \
+                    else f"q[{g.gateOp.target}]"
+                line += f" //{g.gateOp.type} {original}; "
+            lines.append(line)
+
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -12,13 +12,16 @@ class TestBuildLatencyDescriptions(unittest.TestCase):
         self.coupling_map = CouplingMap.from_line(self.num_qubits)
         self.basis_gates = ["rz", "x", "cx", "measure"]
 
+        # Build the qarg tuples once; get_edges() rebuilds its list per call
+        # and the helpers below are invoked several times per test.
+        qargs_1q = tuple((i,) for i in range(self.num_qubits))
+        qargs_2q = tuple(self.coupling_map.get_edges())
+
         def durations_for_1q(gate, duration, unit="dt"):
-            for i in range(self.num_qubits):
-                yield gate, (i,), duration, unit
+            return [(gate, qargs, duration, unit) for qargs in qargs_1q]
 
         def durations_for_2q(gate, duration, unit="dt"):
-            for i, j in self.coupling_map.get_edges():
-                yield gate, (i, j), duration, unit
+            return [(gate, qargs, duration, unit) for qargs in qargs_2q]
 
         self.durations_for_1q = durations_for_1q
         self.durations_for_2q = durations_for_2q